@@ -16,7 +16,7 @@ fn main() {
 		"src/iterators/files.rs",
 	];
 
-	let mut cc_files = vec!["apt-pkg-c/error.cc"];
+	let cc_files = ["apt-pkg-c/error.cc"];
 
 	cxx_build::bridges(&source_files)
 		.files(&cc_files)
@@ -28,21 +28,7 @@ fn main() {
 		println!("cargo:rerun-if-changed={file}")
 	}
 
-	cc_files.extend_from_slice(&[
-		"apt-pkg-c/cache.h",
-		"apt-pkg-c/progress.h",
-		"apt-pkg-c/configuration.h",
-		"apt-pkg-c/util.h",
-		"apt-pkg-c/records.h",
-		"apt-pkg-c/depcache.h",
-		"apt-pkg-c/package.h",
-		"apt-pkg-c/pkgmanager.h",
-		"apt-pkg-c/error.h",
-		"apt-pkg-c/types.h",
-		"apt-pkg-c/acquire.h",
-	]);
-
-	for file in cc_files {
-		println!("cargo:rerun-if-changed={file}")
-	}
+	// Cargo scans a watched directory itself, so every header and source
+	// file in apt-pkg-c is covered without listing each of them here.
+	println!("cargo:rerun-if-changed=apt-pkg-c");
 }